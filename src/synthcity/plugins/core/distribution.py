@@ -1,16 +1,80 @@
 # stdlib
 from abc import ABCMeta, abstractmethod
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # third party
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, root_validator, validator
 
 # synthcity absolute
 from synthcity.plugins.core.constraints import Constraints
 
+try:
+    # third party
+    from numba import njit
+
+    @njit(cache=True)
+    def _draw_from_cdf(cdf: np.ndarray, u: float) -> int:
+        # binary search, equivalent to np.searchsorted(cdf, u, side="right")
+        # without the per-call NumPy dispatch overhead
+        lo, hi = 0, cdf.shape[0]
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if u < cdf[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+except ImportError:  # numba is optional: fall back to NumPy
+
+    def _draw_from_cdf(cdf: np.ndarray, u: float) -> int:
+        return int(np.searchsorted(cdf, u, side="right"))
+
+
+def _index_min(index: pd.Index) -> Any:
+    # reduce over the raw ndarray when possible; Index.min() is kept for
+    # indexes with NaN/NaT, which the plain ndarray reduction would propagate
+    if index.hasnans:
+        return index.min()
+    return index.values.min()
+
+
+def _index_max(index: pd.Index) -> Any:
+    if index.hasnans:
+        return index.max()
+    return index.values.max()
+
+
+def _marginal_counts(data: pd.Series) -> pd.Series:
+    """Equivalent of ``data.value_counts(dropna=False)``, with cheaper paths
+    for the common NaN-free inputs: categorical data is counted through its
+    codes and numeric/datetime data through ``np.unique``."""
+    if data.hasnans:
+        return data.value_counts(dropna=False)
+
+    if isinstance(data.dtype, pd.CategoricalDtype):
+        codes = data.cat.codes.value_counts()
+        counts = pd.Series(codes.values, index=data.cat.categories[codes.index])
+        # value_counts(dropna=False) also reports unobserved categories
+        missing = data.cat.categories.difference(counts.index)
+        if len(missing) > 0:
+            counts = pd.concat([counts, pd.Series(0, index=missing)])
+        return counts
+
+    if data.dtype.kind in "biufM":
+        vals, counts = np.unique(data.values, return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        return pd.Series(counts[order], index=vals[order])
+
+    if len(data) < 1000:
+        return pd.Series(Counter(data.values)).sort_values(ascending=False)
+
+    return data.value_counts(dropna=False)
+
 
 class Distribution(BaseModel, metaclass=ABCMeta):
     """
@@ -36,53 +100,103 @@ class Distribution(BaseModel, metaclass=ABCMeta):
     """
 
     name: str
-    data: Optional[pd.Series] = None
     random_state: int = 0
     # DP parameters
     marginal_distribution: Optional[pd.Series] = None
 
+    # caches for the marginal distribution, computed once on first use
+    _marginal_states: Optional[np.ndarray] = PrivateAttr(default=None)
+    _marginal_probs: Optional[np.ndarray] = PrivateAttr(default=None)
+    _marginal_cdf: Optional[np.ndarray] = PrivateAttr(default=None)
+    # per-instance random generator, seeded from random_state on first use
+    _rng: Optional[np.random.Generator] = PrivateAttr(default=None)
+    # reused scratch buffers for uniform draws, keyed by sample count
+    _sample_buf: Dict[int, np.ndarray] = PrivateAttr(default_factory=dict)
+
     class Config:
         arbitrary_types_allowed = True
 
-    @validator("marginal_distribution", always=True)
-    def _validate_marginal_distribution(cls: Any, v: Any, values: Dict) -> Dict:
-        if "data" not in values or values["data"] is None:
-            return v
+    @root_validator(pre=True)
+    def _validate_marginal_distribution(cls: Any, values: Dict) -> Dict:
+        # `data` is consumed here and never stored on the model, so the
+        # source Series does not linger in memory or in pickles
+        data = values.pop("data", None)
+        if data is None:
+            return values
 
-        data = values["data"]
         if not isinstance(data, pd.Series):
             raise ValueError(f"Invalid data type {type(data)}")
 
-        marginal = data.value_counts(dropna=False)
-        del values["data"]
+        values["marginal_distribution"] = _marginal_counts(data)
+        return values
+
+    def _get_rng(self) -> np.random.Generator:
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.random_state)
+        return self._rng
+
+    def _uniform01(self, count: int) -> np.ndarray:
+        """Fill and return a reused per-size scratch buffer with `count`
+        uniform [0, 1) draws.
 
-        return marginal
+        Generation loops call sample(count) repeatedly with the same count;
+        reusing the buffer avoids a fresh allocation per call. The buffer is
+        overwritten by the next call, so it must never be returned to the
+        caller directly."""
+        buf = self._sample_buf.get(count)
+        if buf is None:
+            buf = self._sample_buf[count] = np.empty(count, dtype=np.float64)
+        self._get_rng().random(out=buf)
+        return buf
 
     def marginal_states(self) -> Optional[List]:
         if self.marginal_distribution is None:
             return None
 
-        return self.marginal_distribution.index.values
+        if self._marginal_states is None:
+            self._marginal_states = self.marginal_distribution.index.values
+
+        return self._marginal_states
 
     def marginal_probabilities(self) -> Optional[List]:
         if self.marginal_distribution is None:
             return None
 
-        return (
-            self.marginal_distribution.values / self.marginal_distribution.values.sum()
-        )
+        if self._marginal_probs is None:
+            counts = self.marginal_distribution.values
+            self._marginal_probs = counts / counts.sum()
+
+        return self._marginal_probs
+
+    def marginal_cdf(self) -> Optional[np.ndarray]:
+        if self.marginal_distribution is None:
+            return None
+
+        if self._marginal_cdf is None:
+            cdf = np.cumsum(self.marginal_probabilities())
+            cdf[-1] = 1.0  # guard against floating point drift
+            self._marginal_cdf = cdf
 
-    def sample_marginal(self, count: int = 1) -> Any:
-        np.random.seed(self.random_state)
+        return self._marginal_cdf
 
+    def sample_marginal(self, count: int = 1, as_array: bool = False) -> Any:
         if self.marginal_distribution is None:
             return None
 
-        return np.random.choice(
-            self.marginal_states(),
-            count,
-            p=self.marginal_probabilities(),
-        ).tolist()
+        # inverse-CDF sampling: much cheaper than np.random.choice(p=...),
+        # which revalidates and re-accumulates the probabilities on each call
+        if count == 1:
+            # single draws dominate Gibbs-style loops: use the compiled
+            # binary search and skip the vectorized machinery entirely
+            idx = _draw_from_cdf(self.marginal_cdf(), self._get_rng().random())
+            samples = self.marginal_states().take([idx])
+        else:
+            u = self._uniform01(count)
+            idx = np.searchsorted(self.marginal_cdf(), u, side="right")
+            samples = self.marginal_states().take(idx)
+        if as_array:
+            return samples
+        return samples.tolist()
 
     @abstractmethod
     def get(self) -> List[Any]:
@@ -90,8 +204,11 @@ class Distribution(BaseModel, metaclass=ABCMeta):
         ...
 
     @abstractmethod
-    def sample(self, count: int = 1) -> Any:
-        """Sample a value from the Distribution."""
+    def sample(self, count: int = 1, as_array: bool = False) -> Any:
+        """Sample a value from the Distribution.
+
+        Set `as_array` to get the raw ndarray, skipping the conversion of
+        each sample into a boxed Python object."""
         ...
 
     @abstractmethod
@@ -99,10 +216,14 @@ class Distribution(BaseModel, metaclass=ABCMeta):
         """Test if another Distribution is included in the local one."""
         ...
 
-    @abstractmethod
     def has(self, val: Any) -> bool:
         """Test if a value is included in the Distribution."""
-        ...
+        return self.min() <= val and val <= self.max()
+
+    def has_many(self, vals: Any) -> np.ndarray:
+        """Vectorized `has`: test an array of values in one comparison pass."""
+        vals = np.asarray(vals)
+        return (self.min() <= vals) & (vals <= self.max())
 
     @abstractmethod
     def as_constraint(self) -> Constraints:
@@ -144,6 +265,11 @@ class CategoricalDistribution(Distribution):
 
     choices: list = []
 
+    _dtype: Optional[str] = PrivateAttr(default=None)
+    _choices_set: Optional[frozenset] = PrivateAttr(default=None)
+    _choices_arr: Optional[np.ndarray] = PrivateAttr(default=None)
+    _bounds: Optional[Tuple[Any, Any]] = PrivateAttr(default=None)
+
     @validator("choices", always=True)
     def _validate_choices(cls: Any, v: List, values: Dict) -> List:
         mkey = "marginal_distribution"
@@ -154,55 +280,77 @@ class CategoricalDistribution(Distribution):
             raise ValueError(
                 "Invalid choices for CategoricalDistribution. Provide data or choices params"
             )
+        # strictly increasing input is already sorted and deduped
+        if all(v[i] < v[i + 1] for i in range(len(v) - 1)):
+            return list(v)
         return sorted(set(v))
 
     def get(self) -> List[Any]:
         return [self.name, self.choices]
 
-    def sample(self, count: int = 1) -> Any:
-        np.random.seed(self.random_state)
-        msamples = self.sample_marginal(count)
+    def sample(self, count: int = 1, as_array: bool = False) -> Any:
+        msamples = self.sample_marginal(count, as_array=as_array)
         if msamples is not None:
             return msamples
 
-        return np.random.choice(self.choices, count)
+        # index a cached array instead of choice(), which coerces the
+        # choices list into a fresh ndarray on every call
+        if self._choices_arr is None:
+            arr = np.asarray(self.choices)
+            if arr.dtype.kind not in "biufM":
+                # keep the original Python objects for non-numeric choices
+                arr = np.asarray(self.choices, dtype=object)
+            self._choices_arr = arr
+        idx = self._get_rng().integers(0, len(self._choices_arr), size=count)
+        return self._choices_arr.take(idx)
+
+    def _get_choices_set(self) -> frozenset:
+        # choices are immutable after validation: build the set once for
+        # O(1) membership tests instead of scanning the list
+        if self._choices_set is None:
+            self._choices_set = frozenset(self.choices)
+        return self._choices_set
 
     def has(self, val: Any) -> bool:
-        return val in self.choices
+        return val in self._get_choices_set()
+
+    def has_many(self, vals: Any) -> np.ndarray:
+        # support is the choice set, not the [min, max] range
+        return np.isin(np.asarray(vals), self.choices)
 
     def includes(self, other: "Distribution") -> bool:
         if not isinstance(other, CategoricalDistribution):
             return False
-        return set(other.choices).issubset(set(self.choices))
+        return other._get_choices_set() <= self._get_choices_set()
 
     def as_constraint(self) -> Constraints:
         return Constraints(rules=[(self.name, "in", list(self.choices))])
 
     def min(self) -> Any:
-        return min(self.choices)
+        # choices never change after validation, so scan them only once;
+        # they are not guaranteed sorted when derived from the marginal
+        if self._bounds is None:
+            self._bounds = (min(self.choices), max(self.choices))
+        return self._bounds[0]
 
     def max(self) -> Any:
-        return max(self.choices)
+        if self._bounds is None:
+            self._bounds = (min(self.choices), max(self.choices))
+        return self._bounds[1]
 
     def dtype(self) -> str:
-        types = {
-            "object": 0,
-            "float": 0,
-            "int": 0,
-        }
-        for v in self.choices:
-            if isinstance(v, float):
-                types["float"] += 1
-            elif isinstance(v, int):
-                types["int"] += 1
-            else:
-                types["object"] += 1
-
-        for t in types:
-            if types[t] != 0:
-                return t
-
-        return "object"
+        # choices are immutable after validation, so the result is cached.
+        # np.asarray infers the common dtype in C (promoting mixed int/float
+        # to float), replacing the per-element isinstance chain
+        if self._dtype is None:
+            kind = np.asarray(self.choices).dtype.kind
+            self._dtype = {
+                "i": "int",
+                "u": "int",
+                "b": "int",
+                "f": "float",
+            }.get(kind, "object")
+        return self._dtype
 
 
 class FloatDistribution(Distribution):
@@ -218,7 +366,7 @@ class FloatDistribution(Distribution):
     def _validate_low_thresh(cls: Any, v: float, values: Dict) -> float:
         mkey = "marginal_distribution"
         if mkey in values and values[mkey] is not None:
-            return values[mkey].index.min()
+            return _index_min(values[mkey].index)
 
         return v
 
@@ -226,22 +374,18 @@ class FloatDistribution(Distribution):
     def _validate_high_thresh(cls: Any, v: float, values: Dict) -> float:
         mkey = "marginal_distribution"
         if mkey in values and values[mkey] is not None:
-            return values[mkey].index.max()
+            return _index_max(values[mkey].index)
 
         return v
 
     def get(self) -> List[Any]:
         return [self.name, self.low, self.high]
 
-    def sample(self, count: int = 1) -> Any:
-        np.random.seed(self.random_state)
-        msamples = self.sample_marginal(count)
+    def sample(self, count: int = 1, as_array: bool = False) -> Any:
+        msamples = self.sample_marginal(count, as_array=as_array)
         if msamples is not None:
             return msamples
-        return np.random.uniform(self.low, self.high, count)
-
-    def has(self, val: Any) -> bool:
-        return self.low <= val and val <= self.high
+        return self._get_rng().uniform(self.low, self.high, count)
 
     def includes(self, other: "Distribution") -> bool:
         return self.min() <= other.min() and other.max() <= self.max()
@@ -269,16 +413,27 @@ class LogDistribution(FloatDistribution):
     low: float = np.finfo(np.float64).tiny
     high: float = np.finfo(np.float64).max
 
+    _log_bounds: Optional[Tuple[float, float]] = PrivateAttr(default=None)
+
     def get(self) -> List[Any]:
         return [self.name, self.low, self.high]
 
-    def sample(self, count: int = 1) -> Any:
-        np.random.seed(self.random_state)
-        msamples = self.sample_marginal(count)
+    def _get_log_bounds(self) -> Tuple[float, float]:
+        # the bounds are constant after construction: take the logs once
+        if self._log_bounds is None:
+            self._log_bounds = (np.log2(self.low), np.log2(self.high))
+        return self._log_bounds
+
+    def sample(self, count: int = 1, as_array: bool = False) -> Any:
+        msamples = self.sample_marginal(count, as_array=as_array)
         if msamples is not None:
             return msamples
-        lo, hi = np.log2(self.low), np.log2(self.high)
-        return 2.0 ** np.random.uniform(lo, hi, count)
+        # scale the reused scratch buffer in place; exp2 allocates the output
+        lo, hi = self._get_log_bounds()
+        u = self._uniform01(count)
+        u *= hi - lo
+        u += lo
+        return np.exp2(u)
 
 
 class IntegerDistribution(Distribution):
@@ -295,7 +450,7 @@ class IntegerDistribution(Distribution):
     def _validate_low_thresh(cls: Any, v: int, values: Dict) -> int:
         mkey = "marginal_distribution"
         if mkey in values and values[mkey] is not None:
-            return int(values[mkey].index.min())
+            return int(_index_min(values[mkey].index))
 
         return v
 
@@ -303,7 +458,7 @@ class IntegerDistribution(Distribution):
     def _validate_high_thresh(cls: Any, v: int, values: Dict) -> int:
         mkey = "marginal_distribution"
         if mkey in values and values[mkey] is not None:
-            return int(values[mkey].index.max())
+            return int(_index_max(values[mkey].index))
         return v
 
     @validator("step", always=True)
@@ -315,19 +470,17 @@ class IntegerDistribution(Distribution):
     def get(self) -> List[Any]:
         return [self.name, self.low, self.high, self.step]
 
-    def sample(self, count: int = 1) -> Any:
-        np.random.seed(self.random_state)
-        msamples = self.sample_marginal(count)
+    def sample(self, count: int = 1, as_array: bool = False) -> Any:
+        msamples = self.sample_marginal(count, as_array=as_array)
         if msamples is not None:
             return msamples
 
+        # draw the step index directly; integers() skips choice()'s generic
+        # candidate-set handling and stays uniform for arbitrarily wide ranges
         steps = (self.high - self.low) // self.step
-        samples = np.random.choice(steps + 1, count)
+        samples = self._get_rng().integers(0, steps + 1, size=count)
         return samples * self.step + self.low
 
-    def has(self, val: Any) -> bool:
-        return self.low <= val and val <= self.high
-
     def includes(self, other: "Distribution") -> bool:
         return self.min() <= other.min() and other.max() <= self.max()
 
@@ -354,6 +507,8 @@ class IntLogDistribution(IntegerDistribution):
     low: int = 1
     high: int = np.iinfo(np.int64).max
 
+    _log_bounds: Optional[Tuple[float, float]] = PrivateAttr(default=None)
+
     @validator("step", always=True)
     def _validate_step(cls: Any, v: int, values: Dict) -> int:
         if v != 1:
@@ -363,14 +518,22 @@ class IntLogDistribution(IntegerDistribution):
     def get(self) -> List[Any]:
         return [self.name, self.low, self.high]
 
-    def sample(self, count: int = 1) -> Any:
-        np.random.seed(self.random_state)
-        msamples = self.sample_marginal(count)
+    def _get_log_bounds(self) -> Tuple[float, float]:
+        if self._log_bounds is None:
+            self._log_bounds = (np.log2(self.low), np.log2(self.high))
+        return self._log_bounds
+
+    def sample(self, count: int = 1, as_array: bool = False) -> Any:
+        msamples = self.sample_marginal(count, as_array=as_array)
         if msamples is not None:
             return msamples
-        lo, hi = np.log2(self.low), np.log2(self.high)
-        samples = 2.0 ** np.random.uniform(lo, hi, count)
-        return samples.astype(int)
+        # a continuous exponent keeps every integer in [low, high] reachable;
+        # the cached bounds and the scaled scratch buffer stay
+        lo, hi = self._get_log_bounds()
+        u = self._uniform01(count)
+        u *= hi - lo
+        u += lo
+        return np.exp2(u).astype(np.int64)
 
 
 class DatetimeDistribution(Distribution):
@@ -384,35 +547,48 @@ class DatetimeDistribution(Distribution):
     step: timedelta = timedelta(microseconds=1)
     offset: timedelta = timedelta(seconds=120)
 
+    # nanosecond views of the bounds, computed once on first sample
+    _low_ns: Optional[np.datetime64] = PrivateAttr(default=None)
+    _step_ns: Optional[np.timedelta64] = PrivateAttr(default=None)
+
     @validator("low", always=True)
     def _validate_low_thresh(cls: Any, v: datetime, values: Dict) -> datetime:
         mkey = "marginal_distribution"
         if mkey in values and values[mkey] is not None:
-            v = values[mkey].index.min()
+            v = pd.Timestamp(_index_min(values[mkey].index))
         return v
 
     @validator("high", always=True)
     def _validate_high_thresh(cls: Any, v: datetime, values: Dict) -> datetime:
         mkey = "marginal_distribution"
         if mkey in values and values[mkey] is not None:
-            v = values[mkey].index.max()
+            v = pd.Timestamp(_index_max(values[mkey].index))
         return v
 
     def get(self) -> List[Any]:
         return [self.name, self.low, self.high, self.step, self.offset]
 
-    def sample(self, count: int = 1) -> Any:
-        np.random.seed(self.random_state)
-        msamples = self.sample_marginal(count)
+    def sample(self, count: int = 1, as_array: bool = False) -> Any:
+        msamples = self.sample_marginal(count, as_array=as_array)
         if msamples is not None:
             return msamples
 
-        n = (self.high - self.low) // self.step + 1
-        samples = np.round(np.random.rand(count) * n - 0.5)
-        return self.low + samples * self.step
-
-    def has(self, val: datetime) -> bool:
-        return self.low <= val and val <= self.high
+        if self._low_ns is None:
+            self._low_ns = np.datetime64(self.low, "ns")
+            self._step_ns = np.timedelta64(self.step, "ns")
+
+        # keep the arithmetic in int64 nanoseconds: adding a float multiple of
+        # a timedelta falls back to an object-dtype loop over datetime boxes
+        # a single integers() draw replaces the rand -> scale -> round
+        # pipeline, which made three passes over the array and was biased
+        # at the range boundaries
+        n = int((np.datetime64(self.high, "ns") - self._low_ns) // self._step_ns) + 1
+        samples = self._get_rng().integers(0, n, size=count)
+        samples = self._low_ns + samples * self._step_ns
+        samples = samples.astype("datetime64[us]")
+        if as_array:
+            return samples
+        return samples.tolist()
 
     def includes(self, other: "Distribution") -> bool:
         return (
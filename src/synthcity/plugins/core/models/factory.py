@@ -1,4 +1,5 @@
 # stdlib
+from functools import lru_cache
 from importlib import import_module
 from typing import Any, Union
 
@@ -87,10 +88,15 @@ FEATURE_ENCODERS = dict(
 )
 
 
+@lru_cache(maxsize=256)
+def _normalize(type_: str) -> str:
+    return type_.lower().replace("_", "")
+
+
 def _get(type_: Union[str, type], params: dict, registry: dict) -> Any:
     if isinstance(type_, type):
         return type_(**params)
-    type_ = type_.lower().replace("_", "")
+    type_ = _normalize(type_)
     if type_ in registry:
         cls = registry[type_]
         if isinstance(cls, str):
@@ -99,6 +105,7 @@ def _get(type_: Union[str, type], params: dict, registry: dict) -> Any:
     raise ValueError(f"Unknown type: {type_}")
 
 
+@lru_cache(maxsize=None)
 def _dynamic_import(path: str) -> type:
     """Avoid circular imports by importing dynamically."""
     if path.startswith("."):
@@ -3,6 +3,7 @@ import random
 from datetime import datetime, timedelta
 
 # third party
+import numpy as np
 import pandas as pd
 
 # synthcity absolute
@@ -11,6 +12,7 @@ from synthcity.plugins.core.distribution import (
     DatetimeDistribution,
     FloatDistribution,
     IntegerDistribution,
+    IntLogDistribution,
     constraint_to_distribution,
 )
 
@@ -74,6 +76,28 @@ def test_categorical_from_data() -> None:
     assert set(param.marginal_distribution.keys()) == set([1, 2, 3, 22])
 
 
+def test_categorical_from_data_with_unused_categories() -> None:
+    param = CategoricalDistribution(
+        name="test",
+        data=pd.Series(pd.Categorical(["a", "a", "b"], categories=["a", "b", "c"])),
+    )
+
+    assert set(param.choices) == set(["a", "b", "c"])
+    assert param.has("c")
+    for sample in param.sample(count=5):
+        assert sample in ["a", "b"]
+
+
+def test_categorical_dtype() -> None:
+    assert CategoricalDistribution(name="test", choices=[1, 2, 3]).dtype() == "int"
+    assert CategoricalDistribution(name="test", choices=[1, 2.5]).dtype() == "float"
+    assert CategoricalDistribution(name="test", choices=["a", "b"]).dtype() == "object"
+
+    # NumPy scalars coming from the marginal index count as numeric too
+    param = CategoricalDistribution(name="test", data=pd.Series([1, 1, 2]))
+    assert param.dtype() == "int"
+
+
 def test_integer() -> None:
     param = IntegerDistribution(name="test", low=0, high=100)
 
@@ -191,6 +215,83 @@ def test_float_from_data() -> None:
     assert set(param.marginal_distribution.keys()) == set([0, 1.1, 2.3, 1.0, 0.5])
 
 
+def test_int_log() -> None:
+    param = IntLogDistribution(name="test", low=5, high=7)
+
+    assert param.get() == ["test", 5, 7]
+    for sample in param.sample(count=100):
+        assert sample in [5, 6, 7]
+
+    param = IntLogDistribution(name="test", low=1000, high=10000)
+    samples = param.sample(count=1000)
+    assert (samples >= 1000).all()
+    assert (samples <= 10000).all()
+    # the support is every integer in the range, not just powers of two
+    assert len(np.unique(samples)) > 20
+
+
+def test_float_from_data_with_nan() -> None:
+    param = FloatDistribution(
+        name="test",
+        data=pd.Series([1.0, 2.0, 3.0, np.nan]),
+    )
+
+    assert param.low == 1.0
+    assert param.high == 3.0
+    assert param.has(2.5)
+    assert not param.has(0.5)
+
+
+def test_datetime_from_data_with_nat() -> None:
+    param = DatetimeDistribution(
+        name="test",
+        data=pd.Series(pd.to_datetime(["2021-01-01", "2021-06-01", None])),
+    )
+
+    assert param.low == datetime(2021, 1, 1)
+    assert param.high == datetime(2021, 6, 1)
+
+
+def test_has_many() -> None:
+    param = IntegerDistribution(name="test", low=0, high=10)
+    assert param.has_many([-1, 0, 5, 11]).tolist() == [False, True, True, False]
+
+    param = FloatDistribution(name="test", low=0, high=1)
+    assert param.has_many(np.asarray([0.5, 1.5])).tolist() == [True, False]
+
+    # categorical membership checks the choice set, not the value range
+    param = CategoricalDistribution(name="test", choices=[1, 3])
+    assert param.has_many([1, 2, 3]).tolist() == [True, False, True]
+
+
+def test_sample_as_array() -> None:
+    param = CategoricalDistribution(name="test", data=pd.Series([1, 1, 2, 3]))
+
+    assert isinstance(param.sample(count=5), list)
+    assert isinstance(param.sample(count=5, as_array=True), np.ndarray)
+    assert isinstance(param.sample_marginal(count=1), list)
+    assert isinstance(param.sample_marginal(count=1, as_array=True), np.ndarray)
+
+    param = DatetimeDistribution(name="test")
+    assert isinstance(param.sample(count=5), list)
+    assert isinstance(param.sample(count=5, as_array=True), np.ndarray)
+
+
+def test_marginal_sampling() -> None:
+    data = pd.Series([1] * 80 + [2] * 15 + [3] * 5)
+    param = CategoricalDistribution(name="test", data=data)
+
+    # the single-draw and the batched inverse-CDF paths must stay within
+    # the observed states
+    for _ in range(100):
+        assert param.sample_marginal(count=1)[0] in [1, 2, 3]
+
+    samples = param.sample_marginal(count=5000, as_array=True)
+    assert set(np.unique(samples)) <= set([1, 2, 3])
+    # frequencies should roughly follow the marginal
+    assert (samples == 1).mean() > 0.5
+
+
 def test_categorical_constraint_to_distribution() -> None:
     param = CategoricalDistribution(name="test", choices=[1, 2, 3, 22])
     constraint = param.as_constraint()